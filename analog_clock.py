@@ -16,11 +16,80 @@ import sys
 import time
 import math
 import ctypes
-from datetime import datetime
 
 # Configuration constants
 SHOW_FPS = True  # Set to False to hide FPS display
 
+# Simple 5x7 bitmap patterns for digits 0-9
+DIGIT_PATTERNS = {
+    '0': ["11111", "10001", "10001", "10001", "10001", "10001", "11111"],
+    '1': ["00100", "01100", "00100", "00100", "00100", "00100", "01110"],
+    '2': ["11111", "00001", "00001", "11111", "10000", "10000", "11111"],
+    '3': ["11111", "00001", "00001", "11111", "00001", "00001", "11111"],
+    '4': ["10001", "10001", "10001", "11111", "00001", "00001", "00001"],
+    '5': ["11111", "10000", "10000", "11111", "00001", "00001", "11111"],
+    '6': ["11111", "10000", "10000", "11111", "10001", "10001", "11111"],
+    '7': ["11111", "00001", "00001", "00001", "00001", "00001", "00001"],
+    '8': ["11111", "10001", "10001", "11111", "10001", "10001", "11111"],
+    '9': ["11111", "10001", "10001", "11111", "00001", "00001", "11111"],
+    '.': ["00000", "00000", "00000", "00000", "00000", "00000", "01100"]
+}
+
+# Angle constants (12 o'clock is at -pi/2, clockwise is positive)
+_HOUR_STEP = math.pi / 6     # One hour on the dial
+_MIN_STEP = math.pi / 30     # One minute (or second) on the dial
+_QUARTER = math.pi / 2
+
+# Sine lookup table for the per-frame hand drawing (1024 steps per turn).
+# The table covers 1.25 turns so cos(a) = sin(a + pi/2) is a plain offset lookup.
+_LUT_SIZE = 1024
+_LUT_SCALE = _LUT_SIZE / (2 * math.pi)
+_SIN_LUT = [math.sin(i * 2 * math.pi / _LUT_SIZE) for i in range(_LUT_SIZE + _LUT_SIZE // 4)]
+
+def lut_index(angle):
+    """Return the lookup table step nearest to angle in radians."""
+    return int((angle * _LUT_SCALE) % _LUT_SIZE + 0.5) & (_LUT_SIZE - 1)
+
+def fast_sincos(angle):
+    """Return (sin, cos) of angle in radians via the lookup table."""
+    idx = lut_index(angle)
+    return _SIN_LUT[idx], _SIN_LUT[idx + _LUT_SIZE // 4]
+
+def sdl_version():
+    """Return the version of the loaded SDL2 library as a (major, minor, patch) tuple."""
+    version = sdl2.SDL_version()
+    sdl2.SDL_GetVersion(ctypes.byref(version))
+    return version.major, version.minor, version.patch
+
+def line_points(x1, y1, x2, y2):
+    """Rasterize a line segment into a list of (x, y) pixels (Bresenham)."""
+    points = []
+    dx = abs(x2 - x1)
+    dy = -abs(y2 - y1)
+    sx = 1 if x1 < x2 else -1
+    sy = 1 if y1 < y2 else -1
+    err = dx + dy
+    while True:
+        points.append((x1, y1))
+        if x1 == x2 and y1 == y2:
+            break
+        e2 = 2 * err
+        if e2 >= dy:
+            err += dy
+            x1 += sx
+        if e2 <= dx:
+            err += dx
+            y1 += sy
+    return points
+
+def to_sdl_points(points):
+    """Pack a list of (x, y) tuples into a ctypes SDL_Point array."""
+    array = (sdl2.SDL_Point * len(points))()
+    for i, (x, y) in enumerate(points):
+        array[i].x = x
+        array[i].y = y
+    return array
+
 class AnalogClock:
     def __init__(self, width=720, height=720, clock_diameter=700):
         self.width = width
@@ -32,6 +101,15 @@ class AnalogClock:
         
         self.window = None
         self.renderer = None
+        self.vsync = False
+        self.face_tex = None
+        self._face_rect = sdl2.SDL_Rect(0, 0, width, height)  # Face texture destination, unscaled
+        self.dot_tex = None
+        self.glyph_tex = {}
+        self.glyph_size = 3  # Pixel size the glyph textures are rendered at
+        self._draw_color = None  # Last color passed to SDL_SetRenderDrawColor
+        self._glyph_cells = {}  # (digit, size) -> lit cell offsets for draw_simple_digit
+        self._glyph_scratch = (sdl2.SDL_Rect * 0)()
         self.running = True
         
         # Clock colors (RGB)
@@ -54,11 +132,31 @@ class AnalogClock:
         self.second_hand_width = 2
         self.center_dot_radius = 8
         
+        # Dial angle of each hour mark
+        self._hour_angles = [hour * _HOUR_STEP - _QUARTER for hour in range(12)]
+        
+        # Hour and minute marks never move - rasterize them once
+        self._hour_mark_points, self._minute_mark_points = self.build_mark_points()
+        
+        self._use_geometry = sdl_version() >= (2, 0, 18)  # SDL_RenderGeometry availability
+        if self._use_geometry:
+            # Reusable quad (two triangles) for drawing the hands
+            self._hand_vertices = (sdl2.SDL_Vertex * 4)()
+            self._hand_indices = (ctypes.c_int * 6)(0, 1, 2, 0, 2, 3)
+        
+        # Local time offset from UTC (refreshed by get_current_time_angles)
+        self._tz_offset = 0
+        self._tz_valid_until = 0.0
+        
         # FPS tracking
         self.frame_count = 0
         self.fps_start_time = time.time()
         self.current_fps = 0.0
         self.fps_update_interval = 1.0  # Update FPS display every second
+        
+        # FPS text at 6 o'clock inside the clock face (refreshed with the FPS value)
+        self._fps_text_y = self.center_y + self.clock_radius - 60
+        self.update_fps_text()
     
     def setup_sdl2(self):
         """Initialize SDL2 for framebuffer rendering."""
@@ -67,6 +165,9 @@ class AnalogClock:
         os.environ['SDL_FBDEV'] = '/dev/fb0'
         os.environ['SDL_NOMOUSE'] = '1'
         
+        # Let SDL coalesce consecutive draw calls into batched submissions
+        sdl2.SDL_SetHint(sdl2.SDL_HINT_RENDER_BATCHING, b"1")
+        
         # Initialize SDL2
         if sdl2.SDL_Init(sdl2.SDL_INIT_VIDEO) != 0:
             print(f"SDL2 initialization failed: {sdl2.SDL_GetError().decode()}")
@@ -98,31 +199,133 @@ class AnalogClock:
             sdl2.SDL_Quit()
             return False
         
+        # Check whether presents are actually synchronized to the display
+        info = sdl2.SDL_RendererInfo()
+        sdl2.SDL_GetRendererInfo(self.renderer, ctypes.byref(info))
+        self.vsync = bool(info.flags & sdl2.SDL_RENDERER_PRESENTVSYNC)
+        
+        # Pre-render the static clock face (border, hour and minute marks)
+        self.create_face_texture()
+        
+        # Pre-render the center dot
+        self.create_dot_texture()
+        
+        # Pre-render the FPS digits
+        self.create_glyph_textures()
+        
         return True
     
+    def create_face_texture(self):
+        """Render the time-invariant clock face once into an off-screen texture."""
+        self.face_tex = sdl2.SDL_CreateTexture(
+            self.renderer,
+            sdl2.SDL_PIXELFORMAT_RGBA8888,
+            sdl2.SDL_TEXTUREACCESS_TARGET,
+            self.width, self.height
+        )
+        
+        if not self.face_tex:
+            # Render targets not supported - fall back to drawing the face every frame
+            print(f"Face texture creation failed: {sdl2.SDL_GetError().decode()}")
+            return False
+        
+        sdl2.SDL_SetTextureBlendMode(self.face_tex, sdl2.SDL_BLENDMODE_BLEND)
+        
+        sdl2.SDL_SetRenderTarget(self.renderer, self.face_tex)
+        self.set_draw_color((0, 0, 0), alpha=0)
+        sdl2.SDL_RenderClear(self.renderer)
+        self.draw_clock_face()
+        sdl2.SDL_SetRenderTarget(self.renderer, None)
+        
+        return True
+    
+    def create_dot_texture(self):
+        """Render the filled center dot once into a texture with a transparent background."""
+        radius = self.center_dot_radius
+        diameter = 2 * radius + 1
+        surface = sdl2.SDL_CreateRGBSurfaceWithFormat(
+            0, diameter, diameter, 32, sdl2.SDL_PIXELFORMAT_RGBA8888
+        )
+        if not surface:
+            print(f"Center dot surface creation failed: {sdl2.SDL_GetError().decode()}")
+            return False
+        
+        # Same horizontal spans as draw_filled_circle_fast
+        r, g, b = self.center_dot_color
+        color = sdl2.SDL_MapRGBA(surface.contents.format, r, g, b, 255)
+        for dy in range(-radius, radius + 1):
+            dx = int(math.sqrt(max(0, radius * radius - dy * dy)))
+            if dx > 0:
+                span = sdl2.SDL_Rect(radius - dx, radius + dy, 2 * dx + 1, 1)
+                sdl2.SDL_FillRect(surface, span, color)
+        
+        self.dot_tex = sdl2.SDL_CreateTextureFromSurface(self.renderer, surface)
+        sdl2.SDL_FreeSurface(surface)
+        if not self.dot_tex:
+            print(f"Center dot texture creation failed: {sdl2.SDL_GetError().decode()}")
+            return False
+        
+        self._dot_rect = sdl2.SDL_Rect(self.center_x - radius, self.center_y - radius, diameter, diameter)
+        return True
+    
+    def create_glyph_textures(self):
+        """Render each bitmap digit once into a white texture (tinted when drawn)."""
+        size = self.glyph_size
+        for char, pattern in DIGIT_PATTERNS.items():
+            surface = sdl2.SDL_CreateRGBSurfaceWithFormat(
+                0, 5 * size, 7 * size, 32, sdl2.SDL_PIXELFORMAT_RGBA8888
+            )
+            if not surface:
+                print(f"Glyph surface creation failed: {sdl2.SDL_GetError().decode()}")
+                return False
+            
+            white = sdl2.SDL_MapRGBA(surface.contents.format, 255, 255, 255, 255)
+            for row, line in enumerate(pattern):
+                for col, pixel in enumerate(line):
+                    if pixel == '1':
+                        rect = sdl2.SDL_Rect(col * size, row * size, size, size)
+                        sdl2.SDL_FillRect(surface, rect, white)
+            
+            texture = sdl2.SDL_CreateTextureFromSurface(self.renderer, surface)
+            sdl2.SDL_FreeSurface(surface)
+            if not texture:
+                print(f"Glyph texture creation failed: {sdl2.SDL_GetError().decode()}")
+                return False
+            self.glyph_tex[char] = texture
+        
+        return True
+    
+    def set_draw_color(self, color, alpha=255):
+        """Set the renderer draw color, skipping the call if it is already set."""
+        rgba = (color, alpha)
+        if rgba != self._draw_color:
+            r, g, b = color
+            sdl2.SDL_SetRenderDrawColor(self.renderer, r, g, b, alpha)
+            self._draw_color = rgba
+    
     def draw_circle_outline(self, x, y, radius, color):
         """Draw a circle outline using SDL2's built-in line drawing."""
-        r, g, b = color
-        sdl2.SDL_SetRenderDrawColor(self.renderer, r, g, b, 255)
-        
-        # Use SDL2's line drawing for much better performance
-        points = []
-        for angle in range(0, 360, 2):  # Draw every 2 degrees for smooth circle
-            rad = math.radians(angle)
-            px = int(x + radius * math.cos(rad))
-            py = int(y + radius * math.sin(rad))
-            points.append((px, py))
-        
-        # Draw lines between consecutive points
-        for i in range(len(points)):
-            x1, y1 = points[i]
-            x2, y2 = points[(i + 1) % len(points)]
-            sdl2.SDL_RenderDrawLine(self.renderer, x1, y1, x2, y2)
+        self.set_draw_color(color)
+        
+        # Walk the circle every 2 degrees by rotating (dx, dy) with the
+        # angle-addition identities instead of calling cos/sin per point
+        steps = 180
+        step_cos = math.cos(math.radians(2))
+        step_sin = math.sin(math.radians(2))
+        points = (sdl2.SDL_Point * (steps + 1))()
+        dx, dy = float(radius), 0.0
+        for i in range(steps):
+            points[i].x = int(x + dx)
+            points[i].y = int(y + dy)
+            dx, dy = dx * step_cos - dy * step_sin, dx * step_sin + dy * step_cos
+        
+        # Close the outline and draw it as one polyline
+        points[steps] = points[0]
+        sdl2.SDL_RenderDrawLines(self.renderer, points, steps + 1)
     
     def draw_filled_circle_fast(self, x, y, radius, color):
         """Draw a filled circle using horizontal lines - much faster."""
-        r, g, b = color
-        sdl2.SDL_SetRenderDrawColor(self.renderer, r, g, b, 255)
+        self.set_draw_color(color)
         
         # Draw horizontal lines to fill the circle
         for dy in range(-radius, radius + 1):
@@ -130,78 +333,86 @@ class AnalogClock:
             if dx > 0:
                 sdl2.SDL_RenderDrawLine(self.renderer, x - dx, y + dy, x + dx, y + dy)
     
-    def draw_line_simple(self, x1, y1, x2, y2, color):
-        """Draw a simple line using SDL2."""
-        r, g, b = color
-        sdl2.SDL_SetRenderDrawColor(self.renderer, r, g, b, 255)
-        sdl2.SDL_RenderDrawLine(self.renderer, int(x1), int(y1), int(x2), int(y2))
-    
     def draw_simple_digit(self, x, y, digit, color, size=3):
         """Draw a simple bitmap digit."""
-        r, g, b = color
-        sdl2.SDL_SetRenderDrawColor(self.renderer, r, g, b, 255)
-        
-        # Simple 5x7 bitmap patterns for digits 0-9
-        patterns = {
-            '0': ["11111", "10001", "10001", "10001", "10001", "10001", "11111"],
-            '1': ["00100", "01100", "00100", "00100", "00100", "00100", "01110"],
-            '2': ["11111", "00001", "00001", "11111", "10000", "10000", "11111"],
-            '3': ["11111", "00001", "00001", "11111", "00001", "00001", "11111"],
-            '4': ["10001", "10001", "10001", "11111", "00001", "00001", "00001"],
-            '5': ["11111", "10000", "10000", "11111", "00001", "00001", "11111"],
-            '6': ["11111", "10000", "10000", "11111", "10001", "10001", "11111"],
-            '7': ["11111", "00001", "00001", "00001", "00001", "00001", "00001"],
-            '8': ["11111", "10001", "10001", "11111", "10001", "10001", "11111"],
-            '9': ["11111", "10001", "10001", "11111", "00001", "00001", "11111"],
-            '.': ["00000", "00000", "00000", "00000", "00000", "00000", "01100"]
-        }
-        
-        if digit not in patterns:
+        if digit not in DIGIT_PATTERNS:
             return
         
-        pattern = patterns[digit]
-        
-        for row, line in enumerate(pattern):
-            for col, pixel in enumerate(line):
-                if pixel == '1':
-                    # Draw a size x size block for each pixel
-                    for dx in range(size):
-                        for dy in range(size):
-                            sdl2.SDL_RenderDrawPoint(self.renderer, 
-                                                   x + col * size + dx, 
-                                                   y + row * size + dy)
+        # Lit cell offsets for this digit and size, built on first use
+        offsets = self._glyph_cells.get((digit, size))
+        if offsets is None:
+            offsets = [
+                (col * size, row * size)
+                for row, line in enumerate(DIGIT_PATTERNS[digit])
+                for col, pixel in enumerate(line)
+                if pixel == '1'
+            ]
+            self._glyph_cells[(digit, size)] = offsets
+        
+        # Translate into the scratch buffer and fill one size x size rect per cell
+        count = len(offsets)
+        if len(self._glyph_scratch) < count:
+            self._glyph_scratch = (sdl2.SDL_Rect * count)()
+        rects = self._glyph_scratch
+        for i, (dx, dy) in enumerate(offsets):
+            rect = rects[i]
+            rect.x = x + dx
+            rect.y = y + dy
+            rect.w = size
+            rect.h = size
+        
+        self.set_draw_color(color)
+        sdl2.SDL_RenderFillRects(self.renderer, rects, count)
     
     def draw_text(self, x, y, text, color, size=3):
         """Draw simple text using bitmap digits."""
         char_width = 6 * size  # 5 pixels + 1 spacing
         current_x = x
         
+        # Blit the pre-rendered glyphs when available at this size
+        if self.glyph_tex and size == self.glyph_size:
+            r, g, b = color
+            dest_rect = sdl2.SDL_Rect(0, y, 5 * size, 7 * size)
+            for char in text:
+                texture = self.glyph_tex.get(char)
+                if texture:
+                    sdl2.SDL_SetTextureColorMod(texture, r, g, b)
+                    dest_rect.x = current_x
+                    sdl2.SDL_RenderCopy(self.renderer, texture, None, dest_rect)
+                current_x += char_width
+            return
+        
         for char in text:
             self.draw_simple_digit(current_x, y, char, color, size)
             current_x += char_width
     
-    def update_fps(self):
-        """Update FPS calculation."""
+    def update_fps(self, current_time=None):
+        """Update FPS calculation.
+        
+        Args:
+            current_time: Frame timestamp from time.time(), read here if None
+        """
         self.frame_count += 1
-        current_time = time.time()
+        if current_time is None:
+            current_time = time.time()
         elapsed = current_time - self.fps_start_time
         
         if elapsed >= self.fps_update_interval:
             self.current_fps = self.frame_count / elapsed
             self.frame_count = 0
             self.fps_start_time = current_time
+            self.update_fps_text()
     
-    def draw_clock_face(self):
-        """Draw the clock face with hour and minute marks - optimized version."""
-        # Draw outer border with simple circle outline
-        self.draw_circle_outline(self.center_x, self.center_y, self.clock_radius + 2, self.border_color)
-        
-        # Draw white clock face outline
-        self.draw_circle_outline(self.center_x, self.center_y, self.clock_radius, self.face_color)
-        
-        # Draw hour marks (simple lines)
-        for hour in range(12):
-            angle = hour * math.pi / 6 - math.pi / 2  # 12 o'clock is at top
+    def update_fps_text(self):
+        """Format the FPS text and center it horizontally."""
+        self._fps_text = f"{self.current_fps:.1f}"
+        text_width = len(self._fps_text) * 6 * 3  # 6 pixels per char * size 3
+        self._fps_text_x = self.center_x - text_width // 2
+    
+    def build_mark_points(self):
+        """Precompute the pixels of all hour and minute marks as SDL_Point arrays."""
+        hour_points = []
+        for angle in self._hour_angles:
             
             # Outer point
             outer_x = self.center_x + (self.clock_radius - 20) * math.cos(angle)
@@ -211,14 +422,16 @@ class AnalogClock:
             inner_x = self.center_x + (self.clock_radius - 50) * math.cos(angle)
             inner_y = self.center_y + (self.clock_radius - 50) * math.sin(angle)
             
-            # Draw 3 lines for thickness (much faster than thick line function)
+            # 3 lines for thickness
             for offset in range(-1, 2):
-                self.draw_line_simple(outer_x + offset, outer_y, inner_x + offset, inner_y, self.hour_marks_color)
+                hour_points.extend(line_points(int(outer_x + offset), int(outer_y),
+                                               int(inner_x + offset), int(inner_y)))
         
-        # Draw minute marks (simple thin lines) - reduced frequency for performance
-        for minute in range(0, 60, 5):  # Only every 5 minutes instead of all 60
+        # Minute marks (simple thin lines) - only every 5 minutes
+        minute_points = []
+        for minute in range(0, 60, 5):
             if minute % 15 != 0:  # Skip quarter hours to avoid overlapping with hour marks
-                angle = minute * math.pi / 30 - math.pi / 2
+                angle = minute * _MIN_STEP - _QUARTER
                 
                 # Outer point
                 outer_x = self.center_x + (self.clock_radius - 10) * math.cos(angle)
@@ -228,68 +441,145 @@ class AnalogClock:
                 inner_x = self.center_x + (self.clock_radius - 25) * math.cos(angle)
                 inner_y = self.center_y + (self.clock_radius - 25) * math.sin(angle)
                 
-                self.draw_line_simple(outer_x, outer_y, inner_x, inner_y, self.minute_marks_color)
+                minute_points.extend(line_points(int(outer_x), int(outer_y),
+                                                 int(inner_x), int(inner_y)))
+        
+        return to_sdl_points(hour_points), to_sdl_points(minute_points)
+    
+    def draw_points(self, points, color):
+        """Draw a precomputed SDL_Point array in a single call."""
+        self.set_draw_color(color)
+        sdl2.SDL_RenderDrawPoints(self.renderer, points, len(points))
+    
+    def draw_clock_face(self):
+        """Draw the clock face with hour and minute marks - optimized version."""
+        # Draw outer border with simple circle outline
+        self.draw_circle_outline(self.center_x, self.center_y, self.clock_radius + 2, self.border_color)
+        
+        # Draw white clock face outline
+        self.draw_circle_outline(self.center_x, self.center_y, self.clock_radius, self.face_color)
+        
+        # Draw hour and minute marks (precomputed, one bulk call per color)
+        self.draw_points(self._hour_mark_points, self.hour_marks_color)
+        self.draw_points(self._minute_mark_points, self.minute_marks_color)
     
     def draw_hand(self, angle, length, width, color):
-        """Draw a clock hand at given angle - optimized version."""
-        end_x = self.center_x + length * math.cos(angle)
-        end_y = self.center_y + length * math.sin(angle)
+        """Draw a clock hand at given angle as a single filled quad."""
+        sin_a, cos_a = fast_sincos(angle)
+        end_x = self.center_x + length * cos_a
+        end_y = self.center_y + length * sin_a
+        
+        if not self._use_geometry:
+            self.draw_hand_lines(sin_a, cos_a, end_x, end_y, width, color)
+            return
+        
+        # Offset perpendicular to the hand direction by half the width
+        half_width = width / 2
+        perp_x = -sin_a * half_width
+        perp_y = cos_a * half_width
+        
+        corners = (
+            (self.center_x + perp_x, self.center_y + perp_y),
+            (end_x + perp_x, end_y + perp_y),
+            (end_x - perp_x, end_y - perp_y),
+            (self.center_x - perp_x, self.center_y - perp_y),
+        )
+        
+        r, g, b = color
+        vertex_color = sdl2.SDL_Color(r, g, b, 255)
+        for vertex, (vx, vy) in zip(self._hand_vertices, corners):
+            vertex.position.x = vx
+            vertex.position.y = vy
+            vertex.color = vertex_color
+        
+        sdl2.SDL_RenderGeometry(self.renderer, None, self._hand_vertices, 4, self._hand_indices, 6)
+    
+    def draw_hand_lines(self, sin_a, cos_a, end_x, end_y, width, color):
+        """Draw a hand as shifted strokes for SDL versions without SDL_RenderGeometry.
+        
+        Each stroke is the hand moved by a whole pixel across its major axis,
+        so neighbouring strokes touch and the hand stays solid. All strokes run
+        from the center outwards; reversed strokes can round differently and
+        leave gaps.
+        """
+        self.set_draw_color(color)
+        
+        # Shift along x for steep hands and along y for flat ones
+        step_x, step_y = (1, 0) if abs(sin_a) >= abs(cos_a) else (0, 1)
+        end_x = int(end_x)
+        end_y = int(end_y)
         
-        # Draw multiple lines for thickness (faster than thick line function)
         half_width = width // 2
         for offset in range(-half_width, half_width + 1):
-            self.draw_line_simple(
-                self.center_x + offset, self.center_y,
-                end_x + offset, end_y, 
-                color
+            off_x = offset * step_x
+            off_y = offset * step_y
+            sdl2.SDL_RenderDrawLine(
+                self.renderer,
+                self.center_x + off_x, self.center_y + off_y,
+                end_x + off_x, end_y + off_y
             )
     
-    def get_current_time_angles(self):
-        """Calculate angles for clock hands based on current time."""
-        now = datetime.now()
+    def get_current_time_angles(self, now=None):
+        """Calculate angles for clock hands based on current time.
         
-        # Get time components with microsecond precision for smooth second hand
-        hours = now.hour % 12
-        minutes = now.minute
-        seconds = now.second + now.microsecond / 1000000.0
+        Args:
+            now: Timestamp from time.time(), read here if None
+        """
+        if now is None:
+            now = time.time()
+        
+        # Local UTC offset, re-read once a minute to follow DST changes
+        if now >= self._tz_valid_until:
+            self._tz_offset = time.localtime(now).tm_gmtoff
+            self._tz_valid_until = now + 60.0
+        
+        # Seconds since the last 12 o'clock (sub-second precision for smooth second hand)
+        t = (now + self._tz_offset) % 43200.0
         
         # Calculate angles (12 o'clock is at -π/2, clockwise is positive)
-        hour_angle = (hours + minutes/60 + seconds/3600) * math.pi / 6 - math.pi / 2
-        minute_angle = (minutes + seconds/60) * math.pi / 30 - math.pi / 2
-        second_angle = seconds * math.pi / 30 - math.pi / 2
+        hour_angle = t * (_HOUR_STEP / 3600) - _QUARTER
+        minute_angle = (t % 3600) * (_MIN_STEP / 60) - _QUARTER
+        second_angle = (t % 60) * _MIN_STEP - _QUARTER
         
         return hour_angle, minute_angle, second_angle
     
-    def draw_clock(self):
-        """Draw the complete analog clock."""
+    def draw_clock(self, hand_angles=None, now=None):
+        """Draw the complete analog clock.
+        
+        Args:
+            hand_angles: (hour, minute, second) angles, computed from the current time if None
+            now: Frame timestamp from time.time(), read when needed if None
+        """
         # Clear background
-        r, g, b = self.bg_color
-        sdl2.SDL_SetRenderDrawColor(self.renderer, r, g, b, 255)
+        self.set_draw_color(self.bg_color)
         sdl2.SDL_RenderClear(self.renderer)
         
-        # Draw clock face
-        self.draw_clock_face()
+        # Draw clock face (pre-rendered texture if available)
+        if self.face_tex:
+            sdl2.SDL_RenderCopy(self.renderer, self.face_tex, None, self._face_rect)
+        else:
+            self.draw_clock_face()
         
         # Get current time angles
-        hour_angle, minute_angle, second_angle = self.get_current_time_angles()
+        if hand_angles is None:
+            hand_angles = self.get_current_time_angles(now)
+        hour_angle, minute_angle, second_angle = hand_angles
         
         # Draw hands (back to front: hour, minute, second)
         self.draw_hand(hour_angle, self.hour_hand_length, self.hour_hand_width, self.hour_hand_color)
         self.draw_hand(minute_angle, self.minute_hand_length, self.minute_hand_width, self.minute_hand_color)
         self.draw_hand(second_angle, self.second_hand_length, self.second_hand_width, self.second_hand_color)
         
-        # Draw center dot
-        self.draw_filled_circle_fast(self.center_x, self.center_y, self.center_dot_radius, self.center_dot_color)
+        # Draw center dot (pre-rendered texture if available)
+        if self.dot_tex:
+            sdl2.SDL_RenderCopy(self.renderer, self.dot_tex, None, self._dot_rect)
+        else:
+            self.draw_filled_circle_fast(self.center_x, self.center_y, self.center_dot_radius, self.center_dot_color)
         
         # Update and draw FPS at 6 o'clock position (if enabled)
         if SHOW_FPS:
-            self.update_fps()
-            fps_text = f"{self.current_fps:.1f}"
-            # Position text at 6 o'clock inside the clock face
-            text_width = len(fps_text) * 6 * 3  # 6 pixels per char * size 3
-            text_x = self.center_x - text_width // 2  # Center the text
-            text_y = self.center_y + self.clock_radius - 60  # Inside the clock face at bottom
-            self.draw_text(text_x, text_y, fps_text, (255, 255, 255), size=3)  # White text
+            self.update_fps(now)
+            self.draw_text(self._fps_text_x, self._fps_text_y, self._fps_text, (255, 255, 255), size=3)  # White text
         else:
             # Still update frame count for potential future use, but don't calculate FPS
             self.frame_count += 1
@@ -316,19 +606,36 @@ class AnalogClock:
         self.fps_start_time = time.time()
         self.frame_count = 0
         
+        # Lookup table steps of the hands in the last drawn frame
+        last_hand_steps = None
+        
         try:
             while self.running:
                 # Handle events
                 self.handle_events()
                 
+                # The hands only move on screen when their lookup table step
+                # changes, so skip frames that would look identical
+                # Read the clock once per iteration and share it with the
+                # hand angles and the FPS counter
+                now = time.time()
+                hand_angles = self.get_current_time_angles(now)
+                hand_steps = tuple(lut_index(angle) for angle in hand_angles)
+                fps_due = SHOW_FPS and now - self.fps_start_time >= self.fps_update_interval
+                if hand_steps == last_hand_steps and not fps_due:
+                    sdl2.SDL_Delay(5)
+                    continue
+                last_hand_steps = hand_steps
+                
                 # Draw clock
-                self.draw_clock()
+                self.draw_clock(hand_angles, now)
                 
                 # Present to screen
                 sdl2.SDL_RenderPresent(self.renderer)
                 
-                # Small delay for smooth animation (~60 FPS)
-                sdl2.SDL_Delay(16)
+                # VSYNC paces the loop; only limit to ~60 FPS without it
+                if not self.vsync:
+                    sdl2.SDL_Delay(16)
                 
         except KeyboardInterrupt:
             print("\nClock stopped by user")
@@ -340,6 +647,12 @@ class AnalogClock:
     
     def cleanup(self):
         """Clean up SDL2 resources."""
+        if self.face_tex:
+            sdl2.SDL_DestroyTexture(self.face_tex)
+        if self.dot_tex:
+            sdl2.SDL_DestroyTexture(self.dot_tex)
+        for texture in self.glyph_tex.values():
+            sdl2.SDL_DestroyTexture(texture)
         if self.renderer:
             sdl2.SDL_DestroyRenderer(self.renderer)
         if self.window:
@@ -18,6 +18,13 @@ __author__ = "HiFiBerry"
 __description__ = "SDL2-based VU meter display with real-time audio monitoring"
 
 from .vu_meter import VUMeter, main
-from .python_vu import VUMonitor
+
+def __getattr__(name):
+    # Import VUMonitor (and with it PyAudio) on first use, so the demo and
+    # fixed modes start without loading the audio stack
+    if name == "VUMonitor":
+        from .python_vu import VUMonitor
+        return VUMonitor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = ['VUMeter', 'VUMonitor', 'main']
\ No newline at end of file
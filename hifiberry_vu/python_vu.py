@@ -30,10 +30,10 @@ Usage:
 
 import pyaudio
 import numpy as np
+import os
 import threading
 import time
 import math
-from collections import deque
 
 
 class VUMonitor:
@@ -66,6 +66,12 @@ class VUMonitor:
         self.update_rate = update_rate
         self.device_index = device_index
         
+        # Deliver about two callbacks per VU update instead of many small
+        # ones, but never less than chunk_size frames. A block as long as the
+        # update period would beat against the update clock, so updates would
+        # alternate between stale levels and two blocks at once.
+        self.frames_per_buffer = max(chunk_size, sample_rate // (2 * update_rate))
+        
         # Audio stream objects
         self.audio = None
         self.stream = None
@@ -73,24 +79,36 @@ class VUMonitor:
         # Threading
         self.recording_thread = None
         self.running = False
-        self.lock = threading.Lock()
+        self.stop_event = threading.Event()  # Wakes the VU calculation thread on stop()
         
         # VU level storage
         self.left_vu_db = -60.0   # Start at minimum level
         self.right_vu_db = -60.0  # Start at minimum level
         self.max_db = -60.0       # Maximum value in latest update period
         
-        # Audio buffer for VU calculation
-        self.audio_buffer = deque(maxlen=int(sample_rate * 0.3))  # 300ms buffer
+        # Latest (left_db, right_db, max_db), replaced as a whole on each update
+        # so readers get a consistent snapshot without locking
+        self.levels = (self.left_vu_db, self.right_vu_db, self.max_db)
+        
+        # Audio ring buffer for VU calculation (300ms, whole interleaved frames),
+        # large enough for at least three callback blocks
+        buffer_size = max(int(sample_rate * 0.3) // channels, 3 * self.frames_per_buffer) * channels
+        self.audio_buffer = np.zeros(buffer_size, dtype=np.int16)
+        # Single-producer/single-consumer positions, counted in samples since
+        # start and never wrapped; each is only ever assigned by one thread,
+        # so the audio callback and the VU thread need no lock
+        self.buffer_written = 0  # Advanced by _audio_callback only
+        self.buffer_read = 0     # Advanced by _calculate_vu_levels only
         
         # VU calculation timing
-        self.last_vu_update = 0
         self.vu_update_interval = 1.0 / update_rate
         
         # VU constants
         self.VU_MIN_DB = -60.0    # Minimum VU level in dB
         self.VU_MAX_DB = 6.0      # Maximum VU level in dB
         self.VU_REFERENCE = 0.707  # 0 dB VU reference level (RMS)
+        self.VU_REFERENCE_DB = 20 * math.log10(self.VU_REFERENCE)  # Reference level in dBFS
+        self.FULL_SCALE = 32768.0  # int16 sample value of a full scale signal
     
     def list_audio_devices(self):
         """List available ALSA audio input devices."""
@@ -100,13 +118,19 @@ class VUMonitor:
         print("Available ALSA Audio Input Devices:")
         print("=" * 40)
         
+        # Look up each host API name once instead of once per device
+        host_apis = {
+            i: self.audio.get_host_api_info_by_index(i)['name']
+            for i in range(self.audio.get_host_api_count())
+        }
+        
         for i in range(self.audio.get_device_count()):
             info = self.audio.get_device_info_by_index(i)
             if info['maxInputChannels'] > 0:  # Only input devices
                 print(f"Device {i}: {info['name']}")
                 print(f"  Channels: {info['maxInputChannels']}")
                 print(f"  Sample Rate: {info['defaultSampleRate']}")
-                print(f"  Host API: {self.audio.get_host_api_info_by_index(info['hostApi'])['name']}")
+                print(f"  Host API: {host_apis[info['hostApi']]}")
                 print()
     
     def start(self):
@@ -129,17 +153,18 @@ class VUMonitor:
             
             # Open audio stream
             self.stream = self.audio.open(
-                format=pyaudio.paFloat32,
+                format=pyaudio.paInt16,
                 channels=self.channels,
                 rate=self.sample_rate,
                 input=True,
                 input_device_index=self.device_index,
-                frames_per_buffer=self.chunk_size,
+                frames_per_buffer=self.frames_per_buffer,
                 stream_callback=self._audio_callback
             )
             
             # Start recording
             self.running = True
+            self.stop_event.clear()
             self.stream.start_stream()
             
             # Start VU calculation thread
@@ -158,6 +183,7 @@ class VUMonitor:
     def stop(self):
         """Stop audio recording and VU monitoring."""
         self.running = False
+        self.stop_event.set()
         
         if self.stream:
             self.stream.stop_stream()
@@ -180,40 +206,69 @@ class VUMonitor:
             print(f"Audio callback status: {status}")
         
         # Convert audio data to numpy array
-        audio_data = np.frombuffer(in_data, dtype=np.float32)
+        audio_data = np.frombuffer(in_data, dtype=np.int16)
+        
+        # Copy into the ring buffer for VU calculation, wrapping at the end
+        buffer = self.audio_buffer
+        size = len(buffer)
+        if len(audio_data) > size:
+            audio_data = audio_data[-size:]
+        count = len(audio_data)
         
-        # Add to buffer for VU calculation
-        with self.lock:
-            self.audio_buffer.extend(audio_data)
+        written = self.buffer_written
+        write = written % size
+        first = min(count, size - write)
+        buffer[write:write + first] = audio_data[:first]
+        buffer[:count - first] = audio_data[first:]
+        
+        # Publish the samples only after they have been stored
+        self.buffer_written = written + count
         
         return (None, pyaudio.paContinue)
     
     def _vu_calculation_loop(self):
         """Background thread for VU level calculation."""
+        # Run at realtime priority so a busy system cannot delay updates.
+        # This needs CAP_SYS_NICE (or root); otherwise keep normal priority.
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(10))
+        except (AttributeError, OSError):
+            pass
+        
+        next_update = time.monotonic()
         while self.running:
-            current_time = time.time()
-            
-            # Check if it's time for VU update
-            if current_time - self.last_vu_update >= self.vu_update_interval:
-                self._calculate_vu_levels()
-                self.last_vu_update = current_time
+            # Sleep until the next update is due; stop() wakes us immediately.
+            # After a stall, continue from now instead of catching up in a burst.
+            now = time.monotonic()
+            next_update = max(next_update + self.vu_update_interval, now)
+            if self.stop_event.wait(next_update - now):
+                break
             
-            # Small sleep to prevent excessive CPU usage
-            time.sleep(0.01)
+            self._calculate_vu_levels()
     
     def _calculate_vu_levels(self):
         """Calculate VU levels for left and right channels."""
-        with self.lock:
-            if len(self.audio_buffer) < self.chunk_size:
-                return  # Not enough data
-            
-            # Convert buffer to numpy array
-            audio_data = np.array(list(self.audio_buffer))
-            
-            # Clear processed data (keep some overlap)
-            overlap_samples = self.chunk_size // 4
-            self.audio_buffer = deque(list(self.audio_buffer)[-overlap_samples:], 
-                                    maxlen=self.audio_buffer.maxlen)
+        buffer = self.audio_buffer
+        size = len(buffer)
+        
+        # Read the producer position once. Leave one block of headroom so the
+        # callback never writes into the part being copied.
+        written = self.buffer_written
+        filled = min(written - self.buffer_read, size - self.frames_per_buffer * self.channels)
+        if filled < self.chunk_size:
+            return  # Not enough data
+        
+        # Copy the valid samples out of the ring buffer, oldest first
+        write = written % size
+        start = write - filled
+        if start >= 0:
+            audio_data = buffer[start:write].copy()
+        else:
+            audio_data = np.concatenate((buffer[start:], buffer[:write]))
+        
+        # Clear processed data (keep some overlap)
+        overlap_samples = self.chunk_size // 4
+        self.buffer_read = written - min(filled, overlap_samples)
         
         if self.channels == 2:
             # Separate left and right channels
@@ -224,25 +279,35 @@ class VUMonitor:
             left_channel = audio_data
             right_channel = audio_data
         
-        # Calculate RMS values
-        left_rms = np.sqrt(np.mean(left_channel**2)) if len(left_channel) > 0 else 0
-        right_rms = np.sqrt(np.mean(right_channel**2)) if len(right_channel) > 0 else 0
+        # Calculate RMS values from an exact int64 sum of squares, scaled to
+        # full scale = 1.0 only at the end
+        left_rms = self._int16_rms(left_channel)
+        right_rms = self._int16_rms(right_channel)
         
         # Convert to dB (VU scale)
         self.left_vu_db = self._rms_to_db(left_rms)
         self.right_vu_db = self._rms_to_db(right_rms)
         
         # Calculate maximum absolute value in the update period
-        max_amplitude = np.max(np.abs(audio_data)) if len(audio_data) > 0 else 0
+        max_amplitude = max(int(audio_data.max()), -int(audio_data.min())) / self.FULL_SCALE
         self.max_db = self._rms_to_db(max_amplitude)
+        
+        # Publish the new levels with a single (atomic) attribute assignment
+        self.levels = (self.left_vu_db, self.right_vu_db, self.max_db)
+    
+    def _int16_rms(self, samples):
+        """Return the RMS of int16 samples relative to full scale (1.0)."""
+        wide = samples.astype(np.int64)
+        return math.sqrt(int(wide @ wide) / len(samples)) / self.FULL_SCALE
     
     def _rms_to_db(self, rms_value):
         """Convert RMS value to dB scale."""
         if rms_value <= 0:
             return self.VU_MIN_DB
         
-        # Calculate dB relative to VU reference level
-        db_value = 20 * math.log10(rms_value / self.VU_REFERENCE)
+        # Calculate dB relative to VU reference level (the division by the
+        # reference is folded into the precomputed VU_REFERENCE_DB)
+        db_value = 20 * math.log10(rms_value) - self.VU_REFERENCE_DB
         
         # Clamp to VU range
         return max(self.VU_MIN_DB, min(self.VU_MAX_DB, db_value))
@@ -254,8 +319,8 @@ class VUMonitor:
         Returns:
             tuple: (left_db, right_db) - VU levels in dB (-60 to +6 dB range)
         """
-        with self.lock:
-            return self.left_vu_db, self.right_vu_db
+        left_db, right_db, _ = self.levels
+        return left_db, right_db
     
     def get_max_db(self):
         """
@@ -267,8 +332,7 @@ class VUMonitor:
         Returns:
             float: Maximum dB level (-60 to +6 dB range)
         """
-        with self.lock:
-            return self.max_db
+        return self.levels[2]
     
     def get_vu_levels_normalized(self):
         """
@@ -14,21 +14,52 @@ Features:
 """
 
 import sdl2
-import sdl2.ext
 import os
 import sys
 import math
-import time
 import ctypes
+import mmap
+import re
+import struct
 import argparse
 from pathlib import Path
 from collections import deque
 
-# Import VU monitoring module
-try:
-    from .python_vu import VUMonitor
-except ImportError:
-    from python_vu import VUMonitor
+
+def line_points(x1, y1, x2, y2):
+    """Rasterize a line segment into a list of (x, y) pixels (Bresenham)."""
+    points = []
+    dx = abs(x2 - x1)
+    dy = -abs(y2 - y1)
+    sx = 1 if x1 < x2 else -1
+    sy = 1 if y1 < y2 else -1
+    err = dx + dy
+    while True:
+        points.append((x1, y1))
+        if x1 == x2 and y1 == y2:
+            break
+        e2 = 2 * err
+        if e2 >= dy:
+            err += dy
+            x1 += sx
+        if e2 <= dx:
+            err += dx
+            y1 += sy
+    return points
+
+def sdl_version():
+    """Return the version of the loaded SDL2 library as a (major, minor, patch) tuple."""
+    version = sdl2.SDL_version()
+    sdl2.SDL_GetVersion(ctypes.byref(version))
+    return version.major, version.minor, version.patch
+
+def to_sdl_points(points):
+    """Pack a list of (x, y) tuples into a ctypes SDL_Point array."""
+    array = (sdl2.SDL_Point * len(points))()
+    for i, (x, y) in enumerate(points):
+        array[i].x = x
+        array[i].y = y
+    return array
 
 
 class DelayRingBuffer:
@@ -98,6 +129,9 @@ class DelayRingBuffer:
         index = -(lookback_samples + 1)
         return self.buffer[index]
 
+# Header of the raw pixel cache files written by VUMeter.load_image: width, height
+PIXEL_CACHE_HEADER = struct.Struct("<II")
+
 def get_image_path(filename):
     """Get the full path to an image file in the img directory."""
     # Try to find img directory relative to this file
@@ -182,6 +216,7 @@ DEFAULT_VU_UPDATE_RATE = 30        # VU level updates per second (for alsa mode)
 DEFAULT_INTEGRATION_MS = 300       # Integration time in milliseconds for VU averaging
 DEFAULT_DELAY_MS = 0               # Delay in milliseconds for VU display
 DEFAULT_FPS_ENABLE = True          # FPS display
+DEFAULT_VSYNC_ENABLE = True        # Sync presents to the display refresh
 VU_METER_OFFSET = DEFAULT_VU_METER_OFFSET  # VU meter offset in dB
 
 # Demo mode settings
@@ -197,6 +232,7 @@ VU_UPDATE_RATE = DEFAULT_VU_UPDATE_RATE
 INTEGRATION_MS = DEFAULT_INTEGRATION_MS
 DELAY_MS = DEFAULT_DELAY_MS
 FPS_ENABLE = DEFAULT_FPS_ENABLE
+VSYNC_ENABLE = DEFAULT_VSYNC_ENABLE
 FIXED_DB = 0.0  # Fixed dB value for fixed mode
 DEBUG_ENABLE = False  # Debug output flag
 CONFIG = None  # Will be set after argument parsing
@@ -213,6 +249,7 @@ Examples:
   %(prog)s --mode=demo --config=simple --rotate=180
   %(prog)s --mode=alsa --config=simple --rotate=0
   %(prog)s --mode=alsa --channel=right --fps
+  %(prog)s --mode=demo --fps --no-vsync
   %(prog)s --mode=alsa --integration-ms=500 --vu-offset=3.0
   %(prog)s --mode=alsa --delay=200
   %(prog)s --mode=fixed --fixed-db=-10.0
@@ -269,6 +306,19 @@ Examples:
         help="Disable FPS display on console"
     )
     
+    parser.add_argument(
+        "--vsync", 
+        action="store_true", 
+        default=DEFAULT_VSYNC_ENABLE,
+        help="Synchronize frames to the display refresh (default: %(default)s)"
+    )
+    
+    parser.add_argument(
+        "--no-vsync", 
+        action="store_true",
+        help="Disable VSYNC and the frame cap to measure the real rendering speed with --fps"
+    )
+    
     parser.add_argument(
         "--update-rate", 
         type=int, 
@@ -315,11 +365,15 @@ Examples:
     if args.no_fps:
         args.fps = False
     
+    # Handle --no-vsync override
+    if args.no_vsync:
+        args.vsync = False
+    
     return args
 
 def initialize_settings(args):
     """Initialize global settings from command line arguments."""
-    global VU_MODE, CURRENT_CONFIG, ROTATE_ANGLE, VU_CHANNEL, VU_UPDATE_RATE, INTEGRATION_MS, DELAY_MS, FPS_ENABLE, CONFIG
+    global VU_MODE, CURRENT_CONFIG, ROTATE_ANGLE, VU_CHANNEL, VU_UPDATE_RATE, INTEGRATION_MS, DELAY_MS, FPS_ENABLE, VSYNC_ENABLE, CONFIG
     global DEMO_ANGLE_RANGE, DEMO_UPDATES_PER_SECOND, DEMO_STEP_SIZE, VU_METER_OFFSET, FIXED_DB, DEBUG_ENABLE
     
     VU_MODE = args.mode
@@ -330,6 +384,7 @@ def initialize_settings(args):
     INTEGRATION_MS = args.integration_ms
     DELAY_MS = args.delay
     FPS_ENABLE = args.fps
+    VSYNC_ENABLE = args.vsync
     VU_METER_OFFSET = args.vu_offset
     FIXED_DB = args.fixed_db
     DEBUG_ENABLE = args.debug
@@ -355,23 +410,52 @@ class VUMeter:
         self.window = None
         self.renderer = None
         self.texture = None
+        self.needle_tex = None
+        self._background_covers_screen = False
+        self.vsync = False
         self.running = True
         
+        # Event buffer reused by handle_events instead of allocating one per call
+        self._event = sdl2.SDL_Event()
+        self._event_ref = ctypes.byref(self._event)
+        
+        # Needle and dB ranges, read from CONFIG once instead of every frame
+        self._min_angle = CONFIG["needle_min_angle"]
+        self._max_angle = CONFIG["needle_max_angle"]
+        self._angle_per_db = (self._max_angle - self._min_angle) / (CONFIG["max_db"] - CONFIG["min_db"])
+        self._min_db = CONFIG["min_db"]
+        self._max_db = CONFIG["max_db"]
+        
         # Demo needle state
-        self.current_needle_angle = CONFIG["needle_min_angle"]
+        self.current_needle_angle = self._min_angle
         self.needle_direction = 1  # 1 for increasing, -1 for decreasing
-        self.last_needle_update = 0
+        self.frame_dt = 0.0  # Seconds since the previous frame, set by run()
+        self.demo_accum = 0.0  # Frame time not yet consumed by fixed demo steps
+        self.prev_needle_angle = self.current_needle_angle  # Demo angle before the last step
+        self._last_frame_key = None  # (needle angle, clip state) of the last presented frame
         
         # VU audio monitoring
         self.vu_monitor = None
+        self._vu_alive = False  # Whether the monitor was running at the last needle update
         if VU_MODE == "alsa":
+            # Import VU monitoring module (PyAudio) only when it is needed
+            try:
+                from .python_vu import VUMonitor
+            except ImportError:
+                from python_vu import VUMonitor
             self.vu_monitor = VUMonitor(update_rate=VU_UPDATE_RATE)
         
         # VU reading averaging for smooth display
         # Calculate buffer size based on integration time and update rate
         # Buffer size = (integration_ms / 1000) * update_rate
+        # Preallocated ring with a running sum, so averaging is O(1) per frame
         buffer_size = max(1, int((INTEGRATION_MS / 1000.0) * VU_UPDATE_RATE))
-        self.vu_readings_buffer = deque(maxlen=buffer_size)
+        self.vu_readings_buffer = [0.0] * buffer_size
+        self.vu_readings_index = 0
+        self.vu_readings_count = 0
+        self.vu_readings_sum = 0.0
+        # Frame time not yet turned into readings; starts full so the first frame samples
+        self.vu_sample_accum = 1.0 / VU_UPDATE_RATE
         
         # Delay ring buffer for VU display
         # Maximum delay buffer: support up to 5 seconds of delay
@@ -380,9 +464,113 @@ class VUMeter:
         
         # FPS tracking
         self.frame_count = 0
-        self.fps_start_time = time.time()
+        # FPS timestamps are performance counter seconds, the clock run() uses for frames
+        self.fps_start_time = sdl2.SDL_GetPerformanceCounter() / sdl2.SDL_GetPerformanceFrequency()
         self.current_fps = 0.0
         self.fps_update_interval = 1.0  # Update FPS console output every second
+        
+        # Needle geometry: a quad for the needle and a triangle fan for the
+        # center dot, drawn together with a single SDL_RenderGeometry call
+        self._center_dot_size = 5
+        self._needle_half_width = CONFIG["needle_width"] / 2
+        self._needle_color = CONFIG["needle_color"]
+        self._sdl_version = sdl_version()
+        self._use_geometry = self._sdl_version >= (2, 0, 18)  # SDL_RenderGeometry availability
+        if not self._use_geometry:
+            # Line offsets and dot pixels for draw_needle_lines
+            self._needle_line_offsets = range(
+                math.floor(-self._needle_half_width), math.floor(self._needle_half_width) + 1
+            )
+            self._dot_disk = to_sdl_points([
+                (dx, dy)
+                for dx in range(-self._center_dot_size, self._center_dot_size + 1)
+                for dy in range(-self._center_dot_size, self._center_dot_size + 1)
+                if dx*dx + dy*dy <= self._center_dot_size*self._center_dot_size
+            ])
+            self._dot_scratch = (sdl2.SDL_Point * len(self._dot_disk))()
+        dot_segments = 16
+        self._dot_offsets = [
+            (self._center_dot_size * math.cos(2 * math.pi * i / dot_segments),
+             self._center_dot_size * math.sin(2 * math.pi * i / dot_segments))
+            for i in range(dot_segments)
+        ]
+        self._needle_vertices = (sdl2.SDL_Vertex * (5 + dot_segments))()
+        r, g, b = self._needle_color
+        for vertex in self._needle_vertices:
+            vertex.color = sdl2.SDL_Color(r, g, b, 255)
+        indices = [0, 1, 2, 0, 2, 3]
+        for i in range(dot_segments):
+            indices += [4, 5 + i, 5 + (i + 1) % dot_segments]
+        self._needle_indices = (ctypes.c_int * len(indices))(*indices)
+        
+        # Screen positions never change, so apply the display rotation once here
+        self._needle_length = int(self.height * CONFIG["needle_length_percent"])
+        self._needle_hub = self.rotate_coordinates(
+            int(self.width * CONFIG["needle_center_x_percent"]),
+            int(self.height * CONFIG["needle_center_y_percent"])
+        )
+        self._clip_center = self.rotate_coordinates(
+            int(self.width * CONFIG.get("clip_detector_x_percent", 0.85)),
+            int(self.height * CONFIG.get("clip_detector_y_percent", 0.15))
+        )
+        
+        # Clipping detector settings, read from CONFIG once instead of every frame
+        self._clip_enabled = CONFIG.get("clip_detector_enabled", False)
+        self._clip_threshold = CONFIG.get("clip_detector_threshold_db", 0.0)
+        self._clip_color_on = CONFIG.get("clip_detector_color_on", (255, 0, 0))
+        self._clip_color_off = CONFIG.get("clip_detector_color_off", (30, 30, 30))
+        self._clip_radius = CONFIG.get("clip_detector_radius", 15)
+        
+        # The clip indicator disk never moves, so rasterize it once
+        center_x, center_y = self._clip_center
+        radius = self._clip_radius
+        self._clip_points = to_sdl_points([
+            (center_x + dx, center_y + dy)
+            for dy in range(-radius, radius + 1)
+            for dx in range(-radius, radius + 1)
+            if dx*dx + dy*dy <= radius*radius
+        ])
+        
+        # Placeholder face, built once so it draws with one call per color
+        self.build_placeholder_points()
+    
+    def build_placeholder_points(self):
+        """Precompute the point arrays used by draw_vu_placeholder."""
+        center_x = self.width // 2
+        center_y = self.height // 2
+        radius = 200
+        
+        # Outer circle (VU meter face), one point every 2 degrees
+        circle = []
+        for angle in range(0, 360, 2):
+            rad = 3.14159 * angle / 180
+            circle.append((int(center_x + radius * math.cos(rad)),
+                           int(center_y + radius * math.sin(rad))))
+        self._placeholder_circle = to_sdl_points(circle)
+        
+        # Scale marks are disjoint segments, so rasterize them into points
+        # rather than joining them with SDL_RenderDrawLines
+        marks = []
+        for i in range(-90, 91, 15):  # -90 to +90 degrees, every 15 degrees
+            angle_rad = 3.14159 * i / 180
+            x1 = int(center_x + (radius - 20) * math.cos(angle_rad))
+            y1 = int(center_y + (radius - 20) * math.sin(angle_rad))
+            x2 = int(center_x + (radius - 10) * math.cos(angle_rad))
+            y2 = int(center_y + (radius - 10) * math.sin(angle_rad))
+            marks.extend(line_points(x1, y1, x2, y2))
+        self._placeholder_marks = to_sdl_points(marks)
+        
+        # Needle (pointing to -20 dB)
+        needle_angle = -3.14159 * 45 / 180  # -45 degrees
+        self._placeholder_needle = (
+            center_x, center_y,
+            int(center_x + (radius - 30) * math.cos(needle_angle)),
+            int(center_y + (radius - 30) * math.sin(needle_angle))
+        )
+        
+        # Center dot and the text frame below the face
+        self._placeholder_dot = sdl2.SDL_Rect(center_x - 3, center_y - 3, 7, 7)
+        self._placeholder_frame = sdl2.SDL_Rect(center_x - 100, center_y + radius + 30, 200, 21)
     
     def setup_sdl2(self):
         """Initialize SDL2 for framebuffer rendering."""
@@ -391,6 +579,9 @@ class VUMeter:
         os.environ['SDL_FBDEV'] = '/dev/fb0'
         os.environ['SDL_NOMOUSE'] = '1'
         
+        # Let SDL coalesce consecutive draw calls into batched submissions
+        sdl2.SDL_SetHint(sdl2.SDL_HINT_RENDER_BATCHING, b"1")
+        
         # Initialize SDL2
         if sdl2.SDL_Init(sdl2.SDL_INIT_VIDEO) != 0:
             print(f"SDL2 initialization failed: {sdl2.SDL_GetError().decode()}")
@@ -411,10 +602,10 @@ class VUMeter:
             return False
         
         # Create renderer
-        self.renderer = sdl2.SDL_CreateRenderer(
-            self.window, -1,
-            sdl2.SDL_RENDERER_ACCELERATED | sdl2.SDL_RENDERER_PRESENTVSYNC
-        )
+        renderer_flags = sdl2.SDL_RENDERER_ACCELERATED
+        if VSYNC_ENABLE:
+            renderer_flags |= sdl2.SDL_RENDERER_PRESENTVSYNC
+        self.renderer = sdl2.SDL_CreateRenderer(self.window, -1, renderer_flags)
         
         if not self.renderer:
             print(f"Renderer creation failed: {sdl2.SDL_GetError().decode()}")
@@ -422,39 +613,212 @@ class VUMeter:
             sdl2.SDL_Quit()
             return False
         
+        # Check whether presents are actually synchronized to the display
+        info = sdl2.SDL_RendererInfo()
+        sdl2.SDL_GetRendererInfo(self.renderer, ctypes.byref(info))
+        self.vsync = bool(info.flags & sdl2.SDL_RENDERER_PRESENTVSYNC)
+        
+        # Pre-render the needle so each frame is a single rotated blit
+        self.create_needle_texture()
+        
         return True
     
+    def _pixel_cache_path(self, image_path):
+        """Return the raw pixel cache file for an image.
+        
+        The name includes the image's modification time and size, so an
+        updated image is decoded again instead of using stale pixels.
+        """
+        cache_dir = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "hifiberry-vu"
+        stat = os.stat(image_path)
+        return cache_dir / f"{Path(image_path).stem}-{stat.st_mtime_ns}-{stat.st_size}-flat.rgba"
+    
+    def _load_cached_surface(self, image_path):
+        """Map previously decoded pixels into an SDL surface, skipping PNG decoding.
+        
+        Returns:
+            (surface, mapping) - the mapping must stay open until the surface is freed,
+            or (None, None) if there is no usable cache
+        """
+        try:
+            cache_path = self._pixel_cache_path(image_path)
+            with open(cache_path, "rb") as f:
+                mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        except (OSError, ValueError):
+            return None, None
+        
+        if len(mapping) < PIXEL_CACHE_HEADER.size:
+            mapping.close()
+            return None, None
+        width, height = PIXEL_CACHE_HEADER.unpack_from(mapping)
+        if len(mapping) != PIXEL_CACHE_HEADER.size + width * height * 4:
+            mapping.close()
+            return None, None
+        
+        pixels = (ctypes.c_ubyte * (width * height * 4)).from_buffer(mapping, PIXEL_CACHE_HEADER.size)
+        surface = sdl2.SDL_CreateRGBSurfaceWithFormatFrom(
+            pixels, width, height, 32, width * 4, sdl2.SDL_PIXELFORMAT_ABGR8888
+        )
+        del pixels
+        if not surface:
+            mapping.close()
+            return None, None
+        return surface, mapping
+    
+    def _store_cached_surface(self, image_path, surface):
+        """Write a decoded ABGR8888 surface to the pixel cache (best effort)."""
+        width = surface.contents.w
+        height = surface.contents.h
+        pitch = surface.contents.pitch
+        row_bytes = width * 4
+        data = ctypes.string_at(surface.contents.pixels, pitch * height)
+        if pitch != row_bytes:
+            data = b"".join(data[y * pitch:y * pitch + row_bytes] for y in range(height))
+        
+        tmp_path = None
+        try:
+            cache_path = self._pixel_cache_path(image_path)
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(PIXEL_CACHE_HEADER.pack(width, height))
+                f.write(data)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"Could not write image cache: {e}")
+            # Do not leave a partial file behind
+            if tmp_path:
+                try:
+                    tmp_path.unlink()
+                except OSError:
+                    pass
+            return
+        
+        # Remove blobs left behind by earlier versions of the same image
+        stale_name = re.compile(re.escape(Path(image_path).stem) + r"-\d+-\d+(-flat)?\.rgba")
+        for path in cache_path.parent.iterdir():
+            if path != cache_path and stale_name.fullmatch(path.name):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+    
+    def _decode_image(self, image_path):
+        """Decode a PNG with SDL_image into an ABGR8888 surface, or return None."""
+        # Try to initialize SDL_image
+        import sdl2.sdlimage as sdlimage
+        
+        if sdlimage.IMG_Init(sdlimage.IMG_INIT_PNG) == 0:
+            print(f"SDL_image PNG support initialization failed: {sdl2.SDL_GetError().decode()}")
+            return None
+        
+        # Load surface
+        surface = sdlimage.IMG_Load(image_path.encode('utf-8'))
+        if not surface:
+            print(f"Failed to load image: {image_path}")
+            print(f"SDL Error: {sdl2.SDL_GetError().decode()}")
+            sdlimage.IMG_Quit()
+            return None
+        
+        # Convert to the cache's pixel layout
+        converted = sdl2.SDL_ConvertSurfaceFormat(surface, sdl2.SDL_PIXELFORMAT_ABGR8888, 0)
+        sdl2.SDL_FreeSurface(surface)
+        sdlimage.IMG_Quit()
+        if not converted:
+            return None
+        
+        try:
+            self._flatten_onto_black(converted)
+        except ImportError:
+            # Still drawable as is, just blended over a cleared screen every frame
+            print("numpy not available - not flattening the background image")
+        return converted
+    
+    def _flatten_onto_black(self, surface):
+        """Composite an ABGR8888 surface onto the black background, in place.
+        
+        The result looks the same as blending it over the cleared screen, but
+        is fully opaque, so draw_vu_meter can skip clearing the screen.
+        """
+        import numpy as np  # Only needed when the pixel cache is cold
+        
+        width = surface.contents.w
+        height = surface.contents.h
+        pitch = surface.contents.pitch
+        buffer = (ctypes.c_ubyte * (pitch * height)).from_address(surface.contents.pixels)
+        pixels = np.frombuffer(buffer, dtype=np.uint8).reshape(height, pitch // 4, 4)[:, :width]
+        
+        alpha = pixels[:, :, 3:4].astype(np.uint16)
+        product = pixels[:, :, :3] * alpha
+        pixels[:, :, :3] = (product + 1 + (product >> 8)) >> 8  # x / 255, as SDL blends
+        pixels[:, :, 3] = 255
+    
+    def _surface_is_opaque(self, surface):
+        """Return True if every pixel of an ABGR8888 surface has alpha 255."""
+        width = surface.contents.w
+        height = surface.contents.h
+        if surface.contents.pitch != width * 4:
+            return False
+        alpha = ctypes.string_at(surface.contents.pixels, width * height * 4)[3::4]
+        return alpha.count(255) == width * height
+    
     def load_image(self, image_path):
-        """Load PNG image as texture."""
+        """Load PNG image as texture.
+        
+        Decoded pixels are cached as a raw blob, so later starts only mmap
+        the file and do not need libpng or SDL_image.
+        """
         if not os.path.exists(image_path):
             print(f"Image file not found: {image_path}")
             return False
         
         try:
-            # Try to initialize SDL_image
-            import sdl2.sdlimage as sdlimage
-            
-            if sdlimage.IMG_Init(sdlimage.IMG_INIT_PNG) == 0:
-                print(f"SDL_image PNG support initialization failed: {sdl2.SDL_GetError().decode()}")
-                return False
-            
-            # Load surface
-            surface = sdlimage.IMG_Load(image_path.encode('utf-8'))
+            surface, mapping = self._load_cached_surface(image_path)
             if not surface:
-                print(f"Failed to load image: {image_path}")
-                print(f"SDL Error: {sdl2.SDL_GetError().decode()}")
-                sdlimage.IMG_Quit()
-                return False
+                surface = self._decode_image(image_path)
+                if not surface:
+                    return False
+                # Only cache flattened (opaque) pixels, so a later run with
+                # numpy does not keep reusing an unflattened copy
+                if self._surface_is_opaque(surface):
+                    self._store_cached_surface(image_path, surface)
             
             # Create texture from surface
+            opaque = self._surface_is_opaque(surface)
             self.texture = sdl2.SDL_CreateTextureFromSurface(self.renderer, surface)
             sdl2.SDL_FreeSurface(surface)
-            sdlimage.IMG_Quit()
+            if mapping:
+                mapping.close()
             
             if not self.texture:
                 print(f"Failed to create texture from image: {sdl2.SDL_GetError().decode()}")
                 return False
             
+            # Texture dimensions never change, so compute the centered
+            # destination rectangle and rotation center once
+            texture_width = ctypes.c_int()
+            texture_height = ctypes.c_int()
+            sdl2.SDL_QueryTexture(
+                self.texture,
+                None,
+                None,
+                ctypes.byref(texture_width),
+                ctypes.byref(texture_height)
+            )
+            x = (self.width - texture_width.value) // 2
+            y = (self.height - texture_height.value) // 2
+            self._dest_rect = sdl2.SDL_Rect(x, y, texture_width.value, texture_height.value)
+            self._center_point = sdl2.SDL_Point(texture_width.value // 2, texture_height.value // 2)
+            
+            # An opaque background that still covers the whole screen after
+            # rotation overwrites every pixel, so the per-frame clear is not needed
+            covers_screen = (
+                x <= 0 and y <= 0
+                and texture_width.value >= self.width and texture_height.value >= self.height
+                and (ROTATE_ANGLE in (0, 180) or texture_width.value == texture_height.value)
+            )
+            self._background_covers_screen = opaque and covers_screen
+            
             print(f"Successfully loaded: {image_path}")
             return True
             
@@ -465,46 +829,83 @@ class VUMeter:
             print(f"Error loading image: {e}")
             return False
     
-    def draw_clip_detector(self):
-        """Draw the clipping detector indicator."""
-        if not CONFIG.get("clip_detector_enabled", False):
-            return
+    def clip_state(self):
+        """Return whether the clipping detector is lit, or None if it is not shown."""
+        if not self._clip_enabled:
+            return None
         
-        # Only draw if we have a VU monitor running
-        if not self.vu_monitor or not self.vu_monitor.is_running():
-            return
+        # Only shown if we have a VU monitor running (checked once per
+        # frame by _update_audio_needle)
+        if not self._vu_alive:
+            return None
         
         # Get delayed max dB level from ring buffer
         _, max_db = self.delay_ring_buffer.get_delayed_sample(DELAY_MS)
         
         # Determine if clipping is occurring
-        threshold = CONFIG.get("clip_detector_threshold_db", 0.0)
-        is_clipping = max_db >= threshold
+        return max_db >= self._clip_threshold
+    
+    def draw_clip_detector(self):
+        """Draw the clipping detector indicator."""
+        is_clipping = self.clip_state()
+        if is_clipping is None:
+            return
         
         # Select color based on clipping state
         if is_clipping:
-            r, g, b = CONFIG.get("clip_detector_color_on", (255, 0, 0))
+            r, g, b = self._clip_color_on
         else:
-            r, g, b = CONFIG.get("clip_detector_color_off", (30, 30, 30))
-        
-        # Calculate position
-        center_x = int(self.width * CONFIG.get("clip_detector_x_percent", 0.85))
-        center_y = int(self.height * CONFIG.get("clip_detector_y_percent", 0.15))
-        radius = CONFIG.get("clip_detector_radius", 15)
-        
-        # Apply rotation to coordinates
-        center_x, center_y = self.rotate_coordinates(center_x, center_y)
+            r, g, b = self._clip_color_off
         
         # Set color
         sdl2.SDL_SetRenderDrawColor(self.renderer, r, g, b, 255)
         
-        # Draw filled circle using midpoint circle algorithm
-        for dy in range(-radius, radius + 1):
-            for dx in range(-radius, radius + 1):
-                if dx*dx + dy*dy <= radius*radius:
-                    sdl2.SDL_RenderDrawPoint(self.renderer, 
-                                           center_x + dx, 
-                                           center_y + dy)
+        # Draw the precomputed filled circle (already rotated for the display)
+        sdl2.SDL_RenderDrawPoints(self.renderer, self._clip_points, len(self._clip_points))
+    
+    def create_needle_texture(self):
+        """Render the needle and center dot once, pointing right, into a texture.
+        
+        draw_needle then only has to blit it with SDL_RenderCopyExF, letting
+        the renderer rotate it around the center dot.
+        """
+        if self._sdl_version < (2, 0, 10):
+            # No SDL_RenderCopyExF - draw the needle every frame instead
+            return False
+        
+        needle_length = self._needle_length
+        margin = self._center_dot_size + 1
+        tex_width = needle_length + 2 * margin
+        tex_height = 2 * margin + 1
+        
+        self.needle_tex = sdl2.SDL_CreateTexture(
+            self.renderer,
+            sdl2.SDL_PIXELFORMAT_RGBA8888,
+            sdl2.SDL_TEXTUREACCESS_TARGET,
+            tex_width, tex_height
+        )
+        if not self.needle_tex:
+            # Render targets not supported - fall back to drawing the geometry every frame
+            print(f"Needle texture creation failed: {sdl2.SDL_GetError().decode()}")
+            return False
+        
+        sdl2.SDL_SetTextureBlendMode(self.needle_tex, sdl2.SDL_BLENDMODE_BLEND)
+        if self._sdl_version >= (2, 0, 12):
+            sdl2.SDL_SetTextureScaleMode(self.needle_tex, sdl2.SDL_ScaleModeLinear)
+        
+        sdl2.SDL_SetRenderTarget(self.renderer, self.needle_tex)
+        sdl2.SDL_SetRenderDrawColor(self.renderer, 0, 0, 0, 0)
+        sdl2.SDL_RenderClear(self.renderer)
+        self.draw_needle_geometry(margin, margin, margin + needle_length, margin)
+        sdl2.SDL_SetRenderTarget(self.renderer, None)
+        
+        # Place the texture so its pivot (the dot center) sits on the rotated needle center
+        needle_center_x, needle_center_y = self._needle_hub
+        self._needle_dest = sdl2.SDL_FRect(
+            needle_center_x - margin, needle_center_y - margin, tex_width, tex_height
+        )
+        self._needle_pivot = sdl2.SDL_FPoint(margin, margin)
+        return True
     
     def draw_needle(self, angle_degrees):
         """Draw the VU meter needle at the specified angle.
@@ -513,33 +914,83 @@ class VUMeter:
             angle_degrees: Angle in degrees (-20 to +20, where 0 is vertical)
         """
         # Clamp angle to valid range
-        angle_degrees = max(CONFIG["needle_min_angle"], min(CONFIG["needle_max_angle"], angle_degrees))
+        angle_degrees = max(self._min_angle, min(self._max_angle, angle_degrees))
         
-        # Calculate needle center position
-        needle_center_x = int(self.width * CONFIG["needle_center_x_percent"])
-        needle_center_y = int(self.height * CONFIG["needle_center_y_percent"])
-        
-        # Calculate needle length
-        needle_length = int(self.height * CONFIG["needle_length_percent"])
+        if self.needle_tex:
+            # The texture points right (-90 degrees on the meter); SDL rotates clockwise
+            sdl2.SDL_RenderCopyExF(
+                self.renderer,
+                self.needle_tex,
+                None,
+                self._needle_dest,
+                angle_degrees - 90 + ROTATE_ANGLE,
+                self._needle_pivot,
+                sdl2.SDL_FLIP_NONE
+            )
+            return
         
         # Convert angle to radians (0 degrees = vertical = -90 degrees in math coords)
-        # Subtract 90 degrees to make 0 degrees point upward (vertical)
-        angle_rad = math.radians(angle_degrees - 90)
+        # and add the display rotation, so the end point is already in screen space
+        angle_rad = math.radians(angle_degrees - 90 + ROTATE_ANGLE)
+        
+        needle_center_x, needle_center_y = self._needle_hub
+        end_x = needle_center_x + self._needle_length * math.cos(angle_rad)
+        end_y = needle_center_y + self._needle_length * math.sin(angle_rad)
         
-        # Calculate needle end point
-        end_x = int(needle_center_x + needle_length * math.cos(angle_rad))
-        end_y = int(needle_center_y + needle_length * math.sin(angle_rad))
+        self.draw_needle_geometry(needle_center_x, needle_center_y, end_x, end_y)
+    
+    def draw_needle_geometry(self, needle_center_x, needle_center_y, end_x, end_y):
+        """Draw the needle quad and center dot between two screen points."""
+        if not self._use_geometry:
+            self.draw_needle_lines(needle_center_x, needle_center_y, end_x, end_y)
+            return
         
-        # Apply rotation to coordinates
-        needle_center_x, needle_center_y = self.rotate_coordinates(needle_center_x, needle_center_y)
-        end_x, end_y = self.rotate_coordinates(end_x, end_y)
+        # Needle direction in screen space
+        dir_x = end_x - needle_center_x
+        dir_y = end_y - needle_center_y
+        dir_len = math.hypot(dir_x, dir_y) or 1.0
+        
+        # Offset perpendicular to the needle by half its width
+        half_width = self._needle_half_width
+        perp_x = -dir_y / dir_len * half_width
+        perp_y = dir_x / dir_len * half_width
+        
+        # Needle as one quad (vertices 0-3), followed by the center dot
+        # as a triangle fan around vertex 4
+        vertices = self._needle_vertices
+        corners = (
+            (needle_center_x + perp_x, needle_center_y + perp_y),
+            (end_x + perp_x, end_y + perp_y),
+            (end_x - perp_x, end_y - perp_y),
+            (needle_center_x - perp_x, needle_center_y - perp_y),
+            (needle_center_x, needle_center_y),
+        )
+        for i, (vx, vy) in enumerate(corners):
+            vertices[i].position.x = vx
+            vertices[i].position.y = vy
+        for i, (dx, dy) in enumerate(self._dot_offsets, 5):
+            vertices[i].position.x = needle_center_x + dx
+            vertices[i].position.y = needle_center_y + dy
+        
+        sdl2.SDL_RenderGeometry(
+            self.renderer, None,
+            vertices, len(vertices),
+            self._needle_indices, len(self._needle_indices)
+        )
+    
+    def draw_needle_lines(self, needle_center_x, needle_center_y, end_x, end_y):
+        """Draw the needle as offset lines for SDL versions without SDL_RenderGeometry."""
+        needle_center_x = int(needle_center_x)
+        needle_center_y = int(needle_center_y)
+        end_x = int(end_x)
+        end_y = int(end_y)
         
         # Set needle color
-        r, g, b = CONFIG["needle_color"]
+        r, g, b = self._needle_color
         sdl2.SDL_SetRenderDrawColor(self.renderer, r, g, b, 255)
         
         # Draw needle with specified thickness
-        for offset in range(-CONFIG["needle_width"]//2, CONFIG["needle_width"]//2 + 1):
+        for offset in self._needle_line_offsets:
             # Draw multiple lines to create thickness
             sdl2.SDL_RenderDrawLine(
                 self.renderer,
@@ -552,14 +1003,12 @@ class VUMeter:
                 end_x, end_y + offset
             )
         
-        # Draw center dot
-        center_dot_size = 5
-        for dx in range(-center_dot_size, center_dot_size + 1):
-            for dy in range(-center_dot_size, center_dot_size + 1):
-                if dx*dx + dy*dy <= center_dot_size*center_dot_size:
-                    sdl2.SDL_RenderDrawPoint(self.renderer, 
-                                           needle_center_x + dx, 
-                                           needle_center_y + dy)
+        # Translate the center dot into the scratch buffer and draw it in one call
+        points = self._dot_scratch
+        for point, offset in zip(points, self._dot_disk):
+            point.x = needle_center_x + offset.x
+            point.y = needle_center_y + offset.y
+        sdl2.SDL_RenderDrawPoints(self.renderer, points, len(points))
     
     def update_needle_angle(self):
         """Update needle angle based on current VU mode."""
@@ -573,26 +1022,33 @@ class VUMeter:
             return NEEDLE_DEFAULT_ANGLE
     
     def _update_demo_needle(self):
-        """Update the demo needle position for animation."""
-        current_time = time.time()
-        
-        # Check if it's time to update (based on DEMO_UPDATES_PER_SECOND)
-        update_interval = 1.0 / DEMO_UPDATES_PER_SECOND
-        if current_time - self.last_needle_update >= update_interval:
-            self.last_needle_update = current_time
-            
-            # Update needle position
-            self.current_needle_angle += self.needle_direction * DEMO_STEP_SIZE
-            
-            # Check bounds and reverse direction if needed
-            if self.current_needle_angle >= CONFIG["needle_max_angle"]:
-                self.current_needle_angle = CONFIG["needle_max_angle"]
-                self.needle_direction = -1  # Start going back
-            elif self.current_needle_angle <= CONFIG["needle_min_angle"]:
-                self.current_needle_angle = CONFIG["needle_min_angle"]
-                self.needle_direction = 1   # Start going forward
+        """Update the demo needle position for animation.
         
-        return self.current_needle_angle
+        The sweep advances in fixed 1/DEMO_UPDATES_PER_SECOND steps and the
+        returned angle is interpolated between the last two steps, so the
+        speed and smoothness do not depend on the display refresh rate.
+        """
+        step_time = 1.0 / DEMO_UPDATES_PER_SECOND
+        self.demo_accum += self.frame_dt
+        while self.demo_accum >= step_time:
+            self.prev_needle_angle = self.current_needle_angle
+            self._advance_demo_needle()
+            self.demo_accum -= step_time
+        
+        alpha = self.demo_accum / step_time
+        return self.prev_needle_angle + (self.current_needle_angle - self.prev_needle_angle) * alpha
+    
+    def _advance_demo_needle(self):
+        """Move the demo needle one fixed step, bouncing at the scale ends."""
+        self.current_needle_angle += self.needle_direction * DEMO_STEP_SIZE
+        
+        # Check bounds and reverse direction if needed
+        if self.current_needle_angle >= self._max_angle:
+            self.current_needle_angle = self._max_angle
+            self.needle_direction = -1  # Start going back
+        elif self.current_needle_angle <= self._min_angle:
+            self.current_needle_angle = self._min_angle
+            self.needle_direction = 1   # Start going forward
     
     def _update_fixed_needle(self):
         """Update needle position based on fixed dB value."""
@@ -602,37 +1058,53 @@ class VUMeter:
         display_db = FIXED_DB + VU_METER_OFFSET
         
         # Convert fixed dB level to needle angle using configurable dB range
-        min_db = CONFIG["min_db"]
-        max_db = CONFIG["max_db"]
-        vu_range = max_db - min_db  # Total VU range in dB
-        vu_normalized = (display_db - min_db) / vu_range  # Normalize to 0.0-1.0
-        vu_normalized = max(0.0, min(1.0, vu_normalized))  # Clamp
-        
-        # Map to needle angle range
-        angle_range = CONFIG["needle_max_angle"] - CONFIG["needle_min_angle"]
-        needle_angle = CONFIG["needle_min_angle"] + (vu_normalized * angle_range)
+        return self.db_to_angle(display_db)
+    
+    def db_to_angle(self, db):
+        """Map a dB level onto the needle angle range, clamped to the scale.
         
-        return needle_angle
+        VU range: min_db to max_db (from configuration)
+        Needle range: needle_min_angle to needle_max_angle
+        """
+        db = max(self._min_db, min(self._max_db, db))
+        return self._min_angle + (db - self._min_db) * self._angle_per_db
     
     def _update_audio_needle(self):
         """Update needle position based on audio VU levels."""
         global VU_METER_OFFSET
         
-        if not self.vu_monitor or not self.vu_monitor.is_running():
+        monitor = self.vu_monitor
+        self._vu_alive = monitor is not None and monitor.is_running()
+        if not self._vu_alive:
             return NEEDLE_DEFAULT_ANGLE
         
-        # Get VU levels from audio monitor
-        left_db, right_db = self.vu_monitor.get_vu_levels()
+        # The averaging ring and delay buffer hold VU_UPDATE_RATE readings per
+        # second, so feed them at that rate however fast frames are drawn
+        step_time = 1.0 / VU_UPDATE_RATE
+        self.vu_sample_accum += self.frame_dt
+        while self.vu_sample_accum >= step_time:
+            self._add_vu_reading(monitor)
+            self.vu_sample_accum -= step_time
+        
+        # Retrieve delayed sample from ring buffer
+        delayed_vu_db, delayed_max_db = self.delay_ring_buffer.get_delayed_sample(DELAY_MS)
         
-        # Get max dB level for clipping detection (not affected by delay)
-        max_db_level = self.vu_monitor.get_max_db()
+        # Convert averaged VU dB level to needle angle using configurable dB range
+        return self.db_to_angle(delayed_vu_db)
+    
+    def _add_vu_reading(self, monitor):
+        """Average the monitor's current level and add it to the delay buffer."""
+        # Get VU levels and the max dB level for clipping detection (not
+        # affected by delay) from one snapshot, so all three come from the
+        # same update
+        left_db, right_db, max_db_level = monitor.levels
         
         # Debug output (print periodically)
         if DEBUG_ENABLE:
             if not hasattr(self, '_debug_counter'):
                 self._debug_counter = 0
             self._debug_counter += 1
-            if self._debug_counter % 60 == 0:  # Print every 60 frames (about once per second at 60fps)
+            if self._debug_counter % VU_UPDATE_RATE == 0:  # Print about once per second
                 print(f"DEBUG: Raw levels - Left: {left_db:.1f} dB, Right: {right_db:.1f} dB")
         
         # Select channel based on VU_CHANNEL setting
@@ -656,19 +1128,29 @@ class VUMeter:
         else:
             vu_db = left_db  # Default to left
         
-        # Add current reading to buffer for averaging
-        self.vu_readings_buffer.append(vu_db)
+        # Add current reading to the ring buffer, replacing the oldest one
+        buffer = self.vu_readings_buffer
+        index = self.vu_readings_index
+        if self.vu_readings_count < len(buffer):
+            self.vu_readings_count += 1
+        else:
+            self.vu_readings_sum -= buffer[index]
+        buffer[index] = vu_db
+        self.vu_readings_sum += vu_db
+        index += 1
+        if index == len(buffer):
+            index = 0
+            # Resum once per wrap so floating point error cannot accumulate
+            self.vu_readings_sum = sum(buffer)
+        self.vu_readings_index = index
         
         # Calculate average of recent readings
-        if len(self.vu_readings_buffer) > 0:
-            avg_vu_db = sum(self.vu_readings_buffer) / len(self.vu_readings_buffer)
-        else:
-            avg_vu_db = vu_db
+        avg_vu_db = self.vu_readings_sum / self.vu_readings_count
         
         # Debug output for averaging
-        if DEBUG_ENABLE and hasattr(self, '_debug_counter') and self._debug_counter % 60 == 0:
+        if DEBUG_ENABLE and hasattr(self, '_debug_counter') and self._debug_counter % VU_UPDATE_RATE == 0:
             print(f"DEBUG: Selected channel ({VU_CHANNEL}): {vu_db:.1f} dB")
-            print(f"DEBUG: Averaged (buffer size {len(self.vu_readings_buffer)}): {avg_vu_db:.1f} dB")
+            print(f"DEBUG: Averaged (buffer size {self.vu_readings_count}): {avg_vu_db:.1f} dB")
             print(f"DEBUG: After offset (+{VU_METER_OFFSET:.1f}): {avg_vu_db + VU_METER_OFFSET:.1f} dB")
         
         # Apply VU meter offset (for display calibration)
@@ -676,32 +1158,19 @@ class VUMeter:
         
         # Add sample to delay ring buffer
         self.delay_ring_buffer.add_sample(avg_vu_db, max_db_level)
+    
+    def update_fps(self, current_time=None):
+        """Update FPS calculation and print to console if enabled.
         
-        # Retrieve delayed sample from ring buffer
-        delayed_vu_db, delayed_max_db = self.delay_ring_buffer.get_delayed_sample(DELAY_MS)
-        
-        # Convert averaged VU dB level to needle angle using configurable dB range
-        # VU range: min_db to max_db (from configuration)
-        # Needle range: needle_min_angle to needle_max_angle
-        min_db = CONFIG["min_db"]
-        max_db = CONFIG["max_db"]
-        vu_range = max_db - min_db  # Total VU range in dB
-        vu_normalized = (delayed_vu_db - min_db) / vu_range  # Normalize to 0.0-1.0
-        vu_normalized = max(0.0, min(1.0, vu_normalized))  # Clamp
-        
-        # Map to needle angle range
-        angle_range = CONFIG["needle_max_angle"] - CONFIG["needle_min_angle"]
-        needle_angle = CONFIG["needle_min_angle"] + (vu_normalized * angle_range)
-        
-        return needle_angle
-    
-    def update_fps(self):
-        """Update FPS calculation and print to console if enabled."""
+        Args:
+            current_time: Frame timestamp in performance counter seconds, read here if None
+        """
         if not FPS_ENABLE:
             return
             
         self.frame_count += 1
-        current_time = time.time()
+        if current_time is None:
+            current_time = sdl2.SDL_GetPerformanceCounter() / sdl2.SDL_GetPerformanceFrequency()
         elapsed = current_time - self.fps_start_time
         
         if elapsed >= self.fps_update_interval:
@@ -733,121 +1202,95 @@ class VUMeter:
         sdl2.SDL_SetRenderDrawColor(self.renderer, 0, 0, 0, 255)
         sdl2.SDL_RenderClear(self.renderer)
         
-        # Draw a simple VU meter representation
-        center_x = self.width // 2
-        center_y = self.height // 2
-        
         # Draw outer circle (VU meter face)
         sdl2.SDL_SetRenderDrawColor(self.renderer, 100, 100, 100, 255)
-        radius = 200
-        for angle in range(0, 360, 2):
-            rad = 3.14159 * angle / 180
-            x = int(center_x + radius * math.cos(rad))
-            y = int(center_y + radius * math.sin(rad))
-            sdl2.SDL_RenderDrawPoint(self.renderer, x, y)
+        sdl2.SDL_RenderDrawPoints(self.renderer, self._placeholder_circle, len(self._placeholder_circle))
         
         # Draw scale marks
         sdl2.SDL_SetRenderDrawColor(self.renderer, 150, 150, 150, 255)
-        for i in range(-90, 91, 15):  # -90 to +90 degrees, every 15 degrees
-            angle_rad = 3.14159 * i / 180
-            x1 = int(center_x + (radius - 20) * math.cos(angle_rad))
-            y1 = int(center_y + (radius - 20) * math.sin(angle_rad))
-            x2 = int(center_x + (radius - 10) * math.cos(angle_rad))
-            y2 = int(center_y + (radius - 10) * math.sin(angle_rad))
-            sdl2.SDL_RenderDrawLine(self.renderer, x1, y1, x2, y2)
+        sdl2.SDL_RenderDrawPoints(self.renderer, self._placeholder_marks, len(self._placeholder_marks))
         
-        # Draw needle (pointing to -20 dB)
-        needle_angle = -3.14159 * 45 / 180  # -45 degrees
+        # Draw needle and center dot
         sdl2.SDL_SetRenderDrawColor(self.renderer, 255, 0, 0, 255)
-        needle_x = int(center_x + (radius - 30) * math.cos(needle_angle))
-        needle_y = int(center_y + (radius - 30) * math.sin(needle_angle))
-        sdl2.SDL_RenderDrawLine(self.renderer, center_x, center_y, needle_x, needle_y)
-        
-        # Draw center dot
-        for x in range(center_x - 3, center_x + 4):
-            for y in range(center_y - 3, center_y + 4):
-                sdl2.SDL_RenderDrawPoint(self.renderer, x, y)
-        
-        # Draw "VU METER" text using simple lines
-        sdl2.SDL_SetRenderDrawColor(self.renderer, 255, 255, 255, 255)
-        text_y = center_y + radius + 30
+        sdl2.SDL_RenderDrawLine(self.renderer, *self._placeholder_needle)
+        sdl2.SDL_RenderFillRect(self.renderer, self._placeholder_dot)
         
         # Simple text: "NO IMAGE - VU PLACEHOLDER"
         # Draw a simple rectangle with text indication
-        rect_x = center_x - 100
-        rect_y = text_y
-        for x in range(rect_x, rect_x + 200):
-            sdl2.SDL_RenderDrawPoint(self.renderer, x, rect_y)
-            sdl2.SDL_RenderDrawPoint(self.renderer, x, rect_y + 20)
-        for y in range(rect_y, rect_y + 21):
-            sdl2.SDL_RenderDrawPoint(self.renderer, rect_x, y)
-            sdl2.SDL_RenderDrawPoint(self.renderer, rect_x + 199, y)
-    
-    def draw_vu_meter(self):
-        """Draw the VU meter image or placeholder."""
+        sdl2.SDL_SetRenderDrawColor(self.renderer, 255, 255, 255, 255)
+        sdl2.SDL_RenderDrawRect(self.renderer, self._placeholder_frame)
+    
+    def draw_vu_meter(self, needle_angle=None):
+        """Draw the VU meter image or placeholder.
+        
+        Args:
+            needle_angle: Needle angle to draw; taken from update_needle_angle() if None
+        """
+        if needle_angle is None:
+            needle_angle = self.update_needle_angle()
+        
         if self.texture:
-            # Clear background with black
-            sdl2.SDL_SetRenderDrawColor(self.renderer, 0, 0, 0, 255)
-            sdl2.SDL_RenderClear(self.renderer)
-            
-            # Get texture dimensions
-            texture_format = ctypes.c_uint32()
-            texture_access = ctypes.c_int()
-            texture_width = ctypes.c_int()
-            texture_height = ctypes.c_int()
-            
-            sdl2.SDL_QueryTexture(
-                self.texture,
-                ctypes.byref(texture_format),
-                ctypes.byref(texture_access),
-                ctypes.byref(texture_width),
-                ctypes.byref(texture_height)
-            )
-            
-            # Calculate position to center the image
-            x = (self.width - texture_width.value) // 2
-            y = (self.height - texture_height.value) // 2
-            
-            # Create destination rectangle
-            dest_rect = sdl2.SDL_Rect(x, y, texture_width.value, texture_height.value)
+            # Clear background with black, unless the background image covers it
+            if not self._background_covers_screen:
+                sdl2.SDL_SetRenderDrawColor(self.renderer, 0, 0, 0, 255)
+                sdl2.SDL_RenderClear(self.renderer)
             
             # Render texture with rotation
-            center_point = sdl2.SDL_Point(texture_width.value // 2, texture_height.value // 2)
             sdl2.SDL_RenderCopyEx(
                 self.renderer, 
                 self.texture, 
                 None, 
-                dest_rect, 
+                self._dest_rect, 
                 ROTATE_ANGLE,  # Rotation angle
-                center_point,  # Center point for rotation
+                self._center_point,  # Center point for rotation
                 sdl2.SDL_FLIP_NONE  # No flipping
             )
-            
-            # Update and draw needle (based on VU mode)
-            needle_angle = self.update_needle_angle()
-            self.draw_needle(needle_angle)
-            
-            # Draw clipping detector
-            self.draw_clip_detector()
         else:
             # Draw placeholder VU meter
             self.draw_vu_placeholder()
-            
-            # Update and draw needle (based on VU mode)
-            needle_angle = self.update_needle_angle()
-            self.draw_needle(needle_angle)
-            
-            # Draw clipping detector
-            self.draw_clip_detector()
+        
+        # Draw needle (based on VU mode)
+        self.draw_needle(needle_angle)
+        
+        # Draw clipping detector
+        self.draw_clip_detector()
     
-    def handle_events(self):
-        """Handle SDL2 events."""
-        event = sdl2.SDL_Event()
-        while sdl2.SDL_PollEvent(ctypes.byref(event)) != 0:
+    def handle_events(self, timeout_ms=0):
+        """Handle SDL2 events.
+        
+        Args:
+            timeout_ms: If > 0, sleep up to this long waiting for the first event
+        """
+        event = self._event
+        waited = timeout_ms > 0 and sdl2.SDL_WaitEventTimeout(self._event_ref, timeout_ms)
+        while waited or sdl2.SDL_PollEvent(self._event_ref) != 0:
+            waited = False
             if event.type == sdl2.SDL_QUIT:
                 self.running = False
+            elif event.type == sdl2.SDL_WINDOWEVENT:
+                # Exposed, restored or resized - repaint even if the needle is still
+                self._last_frame_key = None
+            elif event.type in (sdl2.SDL_RENDER_TARGETS_RESET, sdl2.SDL_RENDER_DEVICE_RESET):
+                self.restore_textures(event.type == sdl2.SDL_RENDER_DEVICE_RESET)
+                self._last_frame_key = None
             # Removed 'q' key exit - only Ctrl+C supported
     
+    def restore_textures(self, device_reset):
+        """Rebuild textures whose contents were lost by a render reset.
+        
+        Args:
+            device_reset: True if every texture was lost, not just render targets
+        """
+        if self.needle_tex:
+            sdl2.SDL_DestroyTexture(self.needle_tex)
+            self.needle_tex = None
+        self.create_needle_texture()
+        
+        if device_reset and self.texture:
+            sdl2.SDL_DestroyTexture(self.texture)
+            self.texture = None
+            self.load_image(CONFIG["image_path"])
+    
     def cleanup(self):
         """Clean up SDL2 and VU monitor resources."""
         # Stop VU monitor
@@ -855,14 +1298,19 @@ class VUMeter:
             self.vu_monitor.stop()
             self.vu_monitor = None
         
-        # Clean up SDL2 resources
+        # Clean up SDL2 resources (safe to call more than once)
         if self.texture:
             sdl2.SDL_DestroyTexture(self.texture)
+            self.texture = None
+        if self.needle_tex:
+            sdl2.SDL_DestroyTexture(self.needle_tex)
+            self.needle_tex = None
         if self.renderer:
             sdl2.SDL_DestroyRenderer(self.renderer)
+            self.renderer = None
         if self.window:
             sdl2.SDL_DestroyWindow(self.window)
-        sdl2.ext.quit()
+            self.window = None
         sdl2.SDL_Quit()
     
     def run(self):
@@ -894,29 +1342,57 @@ class VUMeter:
                 print("ALSA VU monitoring failed - using fixed position")
         print("Press Ctrl+C to exit")
         
-        # Initialize demo needle timing
-        self.last_needle_update = time.time()
+        # Initialize frame timing
+        counter_freq = sdl2.SDL_GetPerformanceFrequency()
+        frame_target = counter_freq // 60  # ~60 FPS when not paced by VSYNC
+        prev_counter = sdl2.SDL_GetPerformanceCounter()
+        last_present = prev_counter
         
-        # Initialize FPS tracking
-        self.fps_start_time = time.time()
+        # Initialize FPS tracking on the same clock as the frame timestamps
+        self.fps_start_time = prev_counter / counter_freq
         self.frame_count = 0
         
         try:
             while self.running:
+                frame_start = sdl2.SDL_GetPerformanceCounter()
+                # Clamp long stalls so the needle does not jump across the scale
+                self.frame_dt = min((frame_start - prev_counter) / counter_freq, 0.25)
+                prev_counter = frame_start
+                
                 # Handle events
                 self.handle_events()
                 
+                # Update needle (based on VU mode); this also feeds the
+                # averaging and delay buffers, so it runs every iteration
+                needle_angle = self.update_needle_angle()
+                
+                # Skip drawing when nothing visible changed and sleep in the
+                # event queue instead, e.g. in fixed mode or during silence.
+                # Still repaint once a second in case the screen was lost
+                # without an event telling us.
+                frame_key = (round(needle_angle, 1), self.clip_state())
+                if frame_key == self._last_frame_key and frame_start - last_present < counter_freq:
+                    self.handle_events(timeout_ms=16)
+                    continue
+                self._last_frame_key = frame_key
+                last_present = frame_start
+                
                 # Draw VU meter
-                self.draw_vu_meter()
+                self.draw_vu_meter(needle_angle)
                 
-                # Update FPS tracking
-                self.update_fps()
+                # Update FPS tracking from the frame start timestamp
+                if FPS_ENABLE:
+                    self.update_fps(frame_start / counter_freq)
                 
                 # Present to screen
                 sdl2.SDL_RenderPresent(self.renderer)
                 
-                # Small delay to prevent excessive CPU usage
-                sdl2.SDL_Delay(16)  # ~60 FPS
+                # VSYNC paces the loop; without it sleep off the rest of the frame,
+                # unless VSYNC was turned off on purpose to run uncapped
+                if VSYNC_ENABLE and not self.vsync:
+                    elapsed = sdl2.SDL_GetPerformanceCounter() - frame_start
+                    if elapsed < frame_target:
+                        sdl2.SDL_Delay((frame_target - elapsed) * 1000 // counter_freq)
                 
         except KeyboardInterrupt:
             print("\nVU Meter stopped by user")
@@ -976,6 +1452,8 @@ def main():
         print(f"Display value: {FIXED_DB + VU_METER_OFFSET:+.1f} dB")
     if FPS_ENABLE:
         print("FPS display enabled (console output)")
+    if not VSYNC_ENABLE:
+        print("VSYNC disabled (uncapped frame rate)")
     print(f"Display rotation: {ROTATE_ANGLE}°")
     print("Exit: Press Ctrl+C")
     print()
@@ -6,6 +6,8 @@ Tests SDL2 functionality and lists available video drivers.
 
 import sys
 import os
+import mmap
+import time
 
 def test_sdl2_import():
     """Test if SDL2 can be imported."""
@@ -93,6 +95,23 @@ def test_framebuffer_access():
                             
                     except Exception as e:
                         print(f"   Could not read framebuffer info: {e}")
+                    
+                    # Check that the framebuffer can be memory-mapped for direct drawing
+                    try:
+                        with open(f'/sys/class/graphics/{os.path.basename(fb_dev)}/virtual_size', 'r') as f:
+                            height = int(f.read().strip().split(',')[1])
+                        with open(f'/sys/class/graphics/{os.path.basename(fb_dev)}/stride', 'r') as f:
+                            stride = int(f.read().strip())
+                        
+                        with mmap.mmap(fb.fileno(), stride * height, prot=mmap.PROT_READ) as mm:
+                            start = time.perf_counter()
+                            data = mm[:]
+                            elapsed = time.perf_counter() - start
+                        
+                        rate = len(data) / elapsed / (1024 * 1024) if elapsed > 0 else 0
+                        print(f"   mmap: OK ({len(data) // 1024} KB read at {rate:.0f} MB/s)")
+                    except Exception as e:
+                        print(f"   mmap: not available ({e})")
                         
             except PermissionError:
                 print(f"⚠️  {fb_dev} exists but access denied (try: sudo usermod -a -G video $USER)")
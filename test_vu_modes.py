@@ -6,50 +6,55 @@ VU Meter Mode Switcher
 Simple script to test different VU meter modes and settings.
 """
 
-import os
+import _thread
 import sys
-import subprocess
+import threading
 import time
 
+# Command line passed to the VU meter on the next run
+VU_ARGS = []
+
 def modify_vu_mode(mode, channel="left"):
-    """Modify the VU_MODE setting in vu_meter.py"""
-    
-    # Read the file
-    with open("vu_meter.py", "r") as f:
-        content = f.read()
+    """Select the VU mode and channel for the next run"""
+    global VU_ARGS
     
-    # Replace VU_MODE setting
-    lines = content.split('\n')
-    for i, line in enumerate(lines):
-        if line.startswith('VU_MODE = '):
-            lines[i] = f'VU_MODE = "{mode}"                  # "demo", "audio", or "fixed"'
-        elif line.startswith('VU_CHANNEL = '):
-            lines[i] = f'VU_CHANNEL = "{channel}"                # "left", "right", or "max" (for audio mode)'
-    
-    # Write back
-    with open("vu_meter.py", "w") as f:
-        f.write('\n'.join(lines))
+    VU_ARGS = [f"--mode={mode}", f"--channel={channel}"]
     
     print(f"✓ Set VU_MODE to '{mode}' with channel '{channel}'")
 
 def run_vu_meter(duration=10):
-    """Run the VU meter for a specified duration"""
+    """Run the VU meter in-process for a specified duration"""
+    from hifiberry_vu import vu_meter
+    
+    # Interrupt the main thread when time is up, like Ctrl+C
+    timer = threading.Timer(duration, _thread.interrupt_main)
+    saved_argv = sys.argv
+    meter = None
     try:
         print(f"Starting VU meter for {duration} seconds...")
-        result = subprocess.run([
-            "timeout", str(duration), "python3", "vu_meter.py"
-        ], capture_output=False, text=True, timeout=duration + 2)
+        sys.argv = [sys.argv[0]] + VU_ARGS
+        vu_meter.initialize_settings(vu_meter.parse_arguments())
+        timer.start()
+        try:
+            meter = vu_meter.VUMeter()
+            meter.run()
+        finally:
+            # The timer may fire during SDL setup, before run() installs its
+            # own cleanup, so stop it and always clean up here as well
+            timer.cancel()
+            timer.join()
+            if meter:
+                meter.cleanup()
         print("VU meter stopped")
         return True
-    except subprocess.TimeoutExpired:
-        print("VU meter timed out")
-        return True
     except KeyboardInterrupt:
-        print("VU meter interrupted by user")
+        print("VU meter interrupted")
         return True
     except Exception as e:
         print(f"Error running VU meter: {e}")
         return False
+    finally:
+        sys.argv = saved_argv
 
 def main():
     """Main test menu"""
@@ -73,15 +78,15 @@ def main():
                 run_vu_meter(10)
             
             elif choice == "2":
-                modify_vu_mode("audio", "left")
+                modify_vu_mode("alsa", "left")
                 run_vu_meter(15)
             
             elif choice == "3":
-                modify_vu_mode("audio", "right")
+                modify_vu_mode("alsa", "right")
                 run_vu_meter(15)
             
             elif choice == "4":
-                modify_vu_mode("audio", "max")
+                modify_vu_mode("alsa", "max")
                 run_vu_meter(15)
             
             elif choice == "5":
@@ -102,10 +107,4 @@ def main():
             print(f"Error: {e}")
 
 if __name__ == "__main__":
-    # Check if we're in the right directory
-    if not os.path.exists("vu_meter.py"):
-        print("Error: vu_meter.py not found in current directory")
-        print("Please run this script from the same directory as vu_meter.py")
-        sys.exit(1)
-    
     main()
\ No newline at end of file